@@ -1,10 +1,18 @@
 """MMAE - Music/Media Audio Editor backend."""
 
+import asyncio
+import hashlib
 import logging
 import os
-import uuid
+import re
+import secrets
+import shutil
 import time
 import io
+import struct
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 logging.basicConfig(
@@ -14,7 +22,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mmae")
 
-import boto3
+import aioboto3
+import numpy as np
+from boto3.s3.transfer import TransferConfig
+from cachetools import LRUCache
+from botocore.config import Config
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -22,7 +34,6 @@ from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from pydub import AudioSegment
 import yt_dlp
 
 DOWNLOADS_DIR = Path(__file__).parent / "downloads"
@@ -34,13 +45,77 @@ ALLOWED_AUDIO_EXTENSIONS = {
 }
 PROXY = os.environ.get("MMAE_PROXY", "")
 
+# Anything that isn't alphanumeric/underscore, space, or dash becomes an
+# underscore. \w keeps unicode letters, matching the old per-char
+# isalnum() check, but the scan now runs as one C-level pass.
+_UNSAFE_NAME_RE = re.compile(r"[^\w -]")
+
 R2_ENDPOINT_URL = os.environ.get("R2_ENDPOINT_URL", "")
 R2_ACCESS_KEY_ID = os.environ.get("R2_ACCESS_KEY_ID", "")
 R2_SECRET_ACCESS_KEY = os.environ.get("R2_SECRET_ACCESS_KEY", "")
 R2_BUCKET_NAME = os.environ.get("R2_BUCKET_NAME", "")
 R2_PUBLIC_URL = os.environ.get("R2_PUBLIC_URL", "")
 
-app = FastAPI(title="MMAE")
+# Worker pool for blocking/CPU work: yt-dlp downloads, clip building,
+# disk writes. Uploads are native-async and don't go through it.
+_POOL = ThreadPoolExecutor(max_workers=16)
+
+# Single shared async S3 client, opened for the app's lifetime in
+# lifespan(). Client construction parses botocore's service models (tens
+# of ms), and a shared client keeps TLS connections warm between clips;
+# aiohttp's cooperative I/O lets N uploads share the event loop without
+# per-upload threads holding the GIL for SSL framing.
+_S3_CONFIG = Config(max_pool_connections=32, retries={"max_attempts": 3, "mode": "adaptive"})
+_S3_SESSION = aioboto3.Session()
+_S3 = None
+
+# Clips below the threshold go out as a single PUT; larger ones are split
+# into parallel multipart uploads by boto3's transfer manager.
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MULTIPART_THRESHOLD,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+async def _janitor() -> None:
+    """Sweep downloads/ on a timer instead of stat'ing every file per request."""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(MAX_AGE_SECONDS / 10)
+        try:
+            await loop.run_in_executor(_POOL, cleanup_old_files)
+        except Exception:
+            logger.exception("Cleanup sweep failed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _S3
+    janitor = asyncio.create_task(_janitor())
+    try:
+        if R2_ENDPOINT_URL:
+            async with _S3_SESSION.client(
+                "s3",
+                endpoint_url=R2_ENDPOINT_URL,
+                aws_access_key_id=R2_ACCESS_KEY_ID,
+                aws_secret_access_key=R2_SECRET_ACCESS_KEY,
+                config=_S3_CONFIG,
+            ) as client:
+                _S3 = client
+                yield
+            _S3 = None
+        else:
+            # No R2 config (e.g. bare README quick start with no .env):
+            # download/upload/playback still work, clip uploads 503.
+            logger.warning("R2_ENDPOINT_URL not set; clip uploads to R2 are disabled")
+            yield
+    finally:
+        janitor.cancel()
+
+
+app = FastAPI(title="MMAE", lifespan=lifespan)
 
 
 # ── Models ──────────────────────────────────────────────────────────────────
@@ -87,21 +162,198 @@ def get_audio_path(file_id: str) -> Path:
     return path
 
 
-def upload_to_r2(data: bytes, key: str) -> str:
+def _parse_wav_header(path: Path) -> tuple[int, int, int, int]:
+    """Walk the RIFF chunks of a PCM16 WAV.
+
+    Returns (data_offset, data_size, sample_rate, channels) without
+    touching the sample data itself.
+    """
+    with open(path, "rb") as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            raise HTTPException(status_code=500, detail="Audio file is not a WAV")
+        sr = nch = None
+        while True:
+            hdr = f.read(8)
+            if len(hdr) < 8:
+                raise HTTPException(status_code=500, detail="WAV file has no data chunk")
+            chunk_id, size = struct.unpack("<4sI", hdr)
+            if chunk_id == b"fmt ":
+                audio_fmt, nch, sr, _, _, bits = struct.unpack_from("<HHIIHH", f.read(size))
+                if audio_fmt != 1 or bits != 16:
+                    raise HTTPException(status_code=500, detail="Audio file is not 16-bit PCM WAV")
+            elif chunk_id == b"data":
+                if sr is None:
+                    raise HTTPException(status_code=500, detail="WAV file has no fmt chunk")
+                return f.tell(), size, sr, nch
+            else:
+                f.seek(size + (size & 1), 1)
+
+
+def load_pcm(path: Path) -> tuple[np.ndarray, int]:
+    """Memory-map a PCM16 WAV as an (nframes, nchannels) int16 array plus sample rate.
+
+    Slicing the result is zero-copy against the page cache; the kernel
+    demand-pages only the regions that are actually touched.
+    """
+    offset, size, sr, nch = _parse_wav_header(path)
+    # Clamp to the bytes actually on disk: streaming encoders write a
+    # 0xFFFFFFFF data size when the output isn't seekable, and truncated
+    # files declare more than they hold; mapping past EOF is a ValueError.
+    size = min(size, path.stat().st_size - offset)
+    nframes = size // (2 * nch)
+    pcm = np.memmap(path, dtype=np.int16, mode="r", offset=offset, shape=(nframes, nch))
+    return pcm, sr
+
+
+def _wav_duration(path: Path) -> float:
+    """Duration in seconds from the header, clamped to the bytes on disk."""
+    offset, size, sr, nch = _parse_wav_header(path)
+    size = min(size, path.stat().st_size - offset)
+    return size // (2 * nch) / sr
+
+
+# LRU keyed on file_id, bounded by total PCM bytes rather than entry
+# count. The arrays are memmapped, so the budget caps mapped bytes (and
+# thus worst-case page-cache pressure), not resident memory.
+_PCM_CACHE: LRUCache = LRUCache(maxsize=2 * 1024**3, getsizeof=lambda v: v[0].nbytes)
+
+
+def get_pcm(file_id: str) -> tuple[np.ndarray, int]:
+    """Return (pcm, sample_rate) for a file_id, memmapped and LRU-cached."""
+    get_audio_path(file_id)  # 404 before consulting the cache
+    cached = _PCM_CACHE.get(file_id)
+    if cached is not None:
+        return cached
+    pcm, sr = load_pcm(DOWNLOADS_DIR / f"{file_id}.wav")
+    try:
+        _PCM_CACHE[file_id] = (pcm, sr)
+    except ValueError:
+        pass  # single file bigger than the whole budget; serve uncached
+    return pcm, sr
+
+
+# RIFF/WAVE/fmt/data header for 16-bit PCM, packed in one call.
+_WAV_HEADER_FMT = "<4sI4s4sIHHIIHH4sI"
+
+
+def _write_wav_into(buf: bytearray, off: int, pcm: np.ndarray, sr: int) -> int:
+    """Write `pcm` as a complete WAV (header + samples) into buf at off.
+
+    One struct.pack_into for the 44-byte header and one memcpy for the
+    samples; the source is already PCM16. Returns the bytes written.
+    """
+    nch = pcm.shape[1]
+    n = pcm.nbytes
+    struct.pack_into(
+        _WAV_HEADER_FMT, buf, off,
+        b"RIFF", 36 + n, b"WAVE",
+        b"fmt ", 16, 1, nch, sr, sr * nch * 2, nch * 2, 16,
+        b"data", n,
+    )
+    dst = np.frombuffer(buf, dtype=np.int16, count=n // 2, offset=off + 44).reshape(pcm.shape)
+    np.copyto(dst, pcm)
+    return 44 + n
+
+
+def _is_pcm16_wav(head: bytes) -> bool:
+    """True if the header bytes declare a classic PCM16 WAV (fmt tag 1).
+
+    Checks the fmt tag directly rather than going through the wave
+    module, whose leniency varies by runtime: 3.12 opens
+    WAVE_FORMAT_EXTENSIBLE (0xFFFE) PCM and reports comptype NONE, but
+    _parse_wav_header would reject that file on every later clip request.
+    Extensible WAVs route through the ffmpeg re-encode instead.
+    """
+    if len(head) < 12 or head[:4] != b"RIFF" or head[8:12] != b"WAVE":
+        return False
+    pos = 12
+    while pos + 8 <= len(head):
+        chunk_id, size = struct.unpack_from("<4sI", head, pos)
+        if chunk_id == b"fmt ":
+            if size < 16 or pos + 8 + 16 > len(head):
+                return False
+            audio_fmt, _, _, _, _, bits = struct.unpack_from("<HHIIHH", head, pos + 8)
+            return audio_fmt == 1 and bits == 16
+        pos += 8 + size + (size & 1)
+    return False
+
+
+def _save_stream(src, dst_path: Path) -> None:
+    """Copy a file object to disk in 1 MB chunks."""
+    with open(dst_path, "wb") as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+
+
+def _build_clips(pcm: np.ndarray, sr: int, regions: list[Region]) -> list[bytes]:
+    """Serialize each region to WAV bytes, in region order.
+
+    Pure CPU/memcpy work — callers run this on the worker pool so long
+    tracks don't stall the event loop. Frame indices and output offsets
+    are computed vectorized up front, and every clip is written into one
+    arena sized by the cumulative total, so the loop body is just a
+    header pack and a memcpy.
+    """
+    nch = pcm.shape[1]
+    starts = np.clip((np.array([r.start for r in regions]) * sr).astype(np.int64), 0, len(pcm))
+    ends = np.clip((np.array([r.end for r in regions]) * sr).astype(np.int64), starts, len(pcm))
+    offsets = np.concatenate(([0], np.cumsum((ends - starts) * (nch * 2) + 44)))
+
+    arena = bytearray(int(offsets[-1]))
+    view = memoryview(arena)
+    blobs = []
+    for i in range(len(regions)):
+        off = int(offsets[i])
+        size = _write_wav_into(arena, off, pcm[starts[i]:ends[i]], sr)
+        blobs.append(bytes(view[off:off + size]))
+    return blobs
+
+
+def _tar_clips(names: list[str], blobs: list[bytes], mtime: int) -> bytes:
+    """Pack clips into one uncompressed tar (WAV PCM doesn't compress)."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tf:
+        for name, data in zip(names, blobs):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = mtime
+            tf.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+# R2 URLs of clips we've already exported, keyed on the exact region.
+# Object keys are content-addressed (see clip_audio), so identical audio
+# lands on the same object even across file_ids.
+_URL_CACHE: LRUCache = LRUCache(maxsize=4096)
+
+
+def _region_cache_key(file_id: str, region: Region) -> tuple[str, int, int]:
+    return (file_id, int(region.start * 1000), int(region.end * 1000))
+
+
+async def upload_to_r2(data: bytes, key: str, content_type: str = "audio/wav") -> str:
     """Upload bytes to Cloudflare R2 and return the public URL."""
+    if _S3 is None:
+        raise HTTPException(
+            status_code=503,
+            detail="R2 storage is not configured (set R2_ENDPOINT_URL and credentials)",
+        )
     logger.info("R2 upload: key=%s size=%d bytes", key, len(data))
-    client = boto3.client(
-        "s3",
-        endpoint_url=R2_ENDPOINT_URL,
-        aws_access_key_id=R2_ACCESS_KEY_ID,
-        aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-    )
-    client.put_object(
-        Bucket=R2_BUCKET_NAME,
-        Key=key,
-        Body=data,
-        ContentType="audio/wav",
-    )
+    if len(data) < _MULTIPART_THRESHOLD:
+        await _S3.put_object(
+            Bucket=R2_BUCKET_NAME,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+        )
+    else:
+        await _S3.upload_fileobj(
+            io.BytesIO(data),
+            R2_BUCKET_NAME,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=_TRANSFER_CONFIG,
+        )
     url = f"{R2_PUBLIC_URL.rstrip('/')}/{key}"
     logger.info("R2 upload done: %s", url)
     return url
@@ -116,10 +368,9 @@ async def index():
 
 @app.post("/api/download")
 async def download_audio(req: DownloadRequest):
-    # cleanup_old_files()
     logger.info("POST /api/download url=%s", req.url)
 
-    file_id = uuid.uuid4().hex[:12]
+    file_id = secrets.token_hex(6)
     output_path = DOWNLOADS_DIR / f"{file_id}.wav"
 
     ydl_opts = {
@@ -141,11 +392,15 @@ async def download_audio(req: DownloadRequest):
     if PROXY:
         ydl_opts["proxy"] = PROXY
 
-    try:
+    def _download() -> str:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(req.url, download=True)
-            title = info.get("title", "audio")
-            logger.info("yt-dlp done: title=%s file_id=%s", title, file_id)
+            return info.get("title", "audio")
+
+    try:
+        # yt-dlp blocks for the whole download; keep it off the event loop.
+        title = await asyncio.get_running_loop().run_in_executor(_POOL, _download)
+        logger.info("yt-dlp done: title=%s file_id=%s", title, file_id)
     except Exception as e:
         logger.error("yt-dlp failed: %s", e)
         raise HTTPException(status_code=400, detail=f"Download failed: {e}")
@@ -153,8 +408,9 @@ async def download_audio(req: DownloadRequest):
     if not output_path.exists():
         raise HTTPException(status_code=500, detail="Audio conversion failed")
 
-    audio = AudioSegment.from_wav(str(output_path))
-    duration = len(audio) / 1000.0  # seconds
+    # yt-dlp already wrote a WAV; the duration comes straight off the
+    # header without decoding any samples.
+    duration = _wav_duration(output_path)
     logger.info("Download complete: file_id=%s duration=%.2fs", file_id, duration)
 
     return {
@@ -178,21 +434,58 @@ async def upload_audio(files: list[UploadFile] = File(...)):
                        f"Allowed: {', '.join(sorted(ALLOWED_AUDIO_EXTENSIONS))}",
             )
 
-        file_id = uuid.uuid4().hex[:12]
+        file_id = secrets.token_hex(6)
         output_path = DOWNLOADS_DIR / f"{file_id}.wav"
 
-        raw_bytes = await f.read()
-        try:
-            audio = AudioSegment.from_file(io.BytesIO(raw_bytes))
-        except Exception as e:
-            logger.error("Decode failed for '%s': %s", f.filename, e)
-            raise HTTPException(
-                status_code=400,
-                detail=f"Could not decode '{f.filename}': {e}",
-            )
+        # Peek at the head only — enough to tell whether this is already
+        # a PCM16 WAV — then rewind; the body never sits in memory whole.
+        head = await f.read(65536)
+        await f.seek(0)
 
-        audio.export(str(output_path), format="wav")
-        duration = len(audio) / 1000.0
+        passthrough = ext == ".wav" and _is_pcm16_wav(head)
+
+        if passthrough:
+            # Already a PCM16 WAV: stream it straight to disk.
+            await asyncio.get_running_loop().run_in_executor(
+                _POOL, _save_stream, f.file, output_path
+            )
+            logger.info("Upload stored (wav passthrough): file_id=%s", file_id)
+        else:
+            # Single ffmpeg pass: decode from stdin fed in 1 MB chunks,
+            # writing the WAV straight to its final path (a real file, so
+            # ffmpeg can patch the header).
+            # pcm_s16le is pinned explicitly: the whole clip pipeline
+            # (memmap, slicing, header) assumes int16 and never widens to
+            # float, which would double memory bandwidth for no benefit.
+            proc = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-v", "error", "-y", "-i", "pipe:0",
+                "-c:a", "pcm_s16le", "-f", "wav", str(output_path),
+                stdin=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            async def _feed() -> None:
+                try:
+                    while chunk := await f.read(1 << 20):
+                        proc.stdin.write(chunk)
+                        await proc.stdin.drain()
+                    proc.stdin.close()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # ffmpeg bailed early; its stderr tells us why below
+
+            # Feed stdin and drain stderr together: if the stderr pipe
+            # fills while we're still feeding, ffmpeg blocks on it and
+            # stops reading stdin, deadlocking a sequential feed.
+            _, err = await asyncio.gather(_feed(), proc.stderr.read())
+            await proc.wait()
+            if proc.returncode != 0 or not output_path.exists():
+                detail = err.decode(errors="replace").strip() or "unknown error"
+                logger.error("Decode failed for '%s': %s", f.filename, detail)
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Could not decode '{f.filename}': {detail}",
+                )
+
+        duration = _wav_duration(output_path)
 
         original_name = Path(f.filename or "audio").stem
         logger.info("Upload done: file_id=%s name=%s duration=%.2fs", file_id, original_name, duration)
@@ -208,7 +501,6 @@ async def upload_audio(files: list[UploadFile] = File(...)):
 @app.get("/api/audio/{file_id}")
 async def serve_audio(file_id: str):
     logger.info("GET /api/audio/%s", file_id)
-    cleanup_old_files()
     path = get_audio_path(file_id)
     return FileResponse(path, media_type="audio/wav", filename=f"{file_id}.wav")
 
@@ -216,36 +508,45 @@ async def serve_audio(file_id: str):
 @app.post("/api/clip")
 async def clip_audio(req: ClipRequest):
     logger.info("POST /api/clip file_id=%s regions=%d", req.file_id, len(req.regions))
-    cleanup_old_files()
-    path = get_audio_path(req.file_id)
 
     if not req.regions:
         raise HTTPException(status_code=400, detail="No regions specified")
 
-    audio = AudioSegment.from_wav(str(path))
-    timestamp = int(time.time())
-    clips = []
-
-    for i, region in enumerate(req.regions, start=1):
-        start_ms = int(region.start * 1000)
-        end_ms = int(region.end * 1000)
-        clip = audio[start_ms:end_ms]
-
-        clip_buf = io.BytesIO()
-        clip.export(clip_buf, format="wav")
-        clip_bytes = clip_buf.getvalue()
-
-        name = f"clip_{i:03d}_{region.start:.3f}s-{region.end:.3f}s.wav"
-        key = f"clips/{timestamp}_{req.file_id}/{name}"
-        url = upload_to_r2(clip_bytes, key)
-        clips.append({"name": name, "url": url})
-
+    pcm, sr = get_pcm(req.file_id)
+    loop = asyncio.get_running_loop()
+
+    names = [
+        f"clip_{i:03d}_{region.start:.3f}s-{region.end:.3f}s.wav"
+        for i, region in enumerate(req.regions, start=1)
+    ]
+    cache_keys = [_region_cache_key(req.file_id, region) for region in req.regions]
+    urls: list[str | None] = [_URL_CACHE.get(k) for k in cache_keys]
+    hits = sum(url is not None for url in urls)
+    if hits:
+        logger.info("URL cache: %d/%d regions already uploaded", hits, len(urls))
+
+    # Only the regions we haven't uploaded before cost CPU or network.
+    miss_idx = [i for i, url in enumerate(urls) if url is None]
+    if miss_idx:
+        miss_regions = [req.regions[i] for i in miss_idx]
+        blobs = await loop.run_in_executor(_POOL, _build_clips, pcm, sr, miss_regions)
+        # Content-addressed keys: re-requesting identical audio (even via
+        # another file_id) overwrites the same object instead of piling
+        # up duplicates.
+        keys = [f"clips/{hashlib.sha1(data).hexdigest()}.wav" for data in blobs]
+        miss_urls = await asyncio.gather(
+            *[upload_to_r2(data, key) for data, key in zip(blobs, keys)]
+        )
+        for i, url in zip(miss_idx, miss_urls):
+            urls[i] = url
+            _URL_CACHE[cache_keys[i]] = url
+
+    clips = [{"name": name, "url": url} for name, url in zip(names, urls)]
     return {"clips": clips}
 
 
 @app.post("/api/clip-multi")
 async def clip_multi(req: ClipMultiRequest):
-    # cleanup_old_files()
     total_regions = sum(len(t.regions) for t in req.tracks)
     logger.info("POST /api/clip-multi tracks=%d total_regions=%d", len(req.tracks), total_regions)
 
@@ -253,41 +554,45 @@ async def clip_multi(req: ClipMultiRequest):
         raise HTTPException(status_code=400, detail="No tracks specified")
 
     timestamp = int(time.time())
-    data_items = []
+    loop = asyncio.get_running_loop()
 
+    # Phase 1 (CPU): slice every track's clips and pack them into one
+    # uncompressed tar per track, one pool dispatch each.
+    tracks_out = []
     for track in req.tracks:
-        path = get_audio_path(track.file_id)
+        get_audio_path(track.file_id)
         if not track.regions:
             logger.info("  Track '%s' has no regions, skipping", track.track_name)
             continue
         logger.info("  Track '%s' file_id=%s regions=%d", track.track_name, track.file_id, len(track.regions))
-        audio = AudioSegment.from_wav(str(path))
-        safe_name = "".join(
-            c if c.isalnum() or c in (" ", "-", "_") else "_"
-            for c in track.track_name
-        ).strip() or track.file_id
+        pcm, sr = get_pcm(track.file_id)
+        safe_name = _UNSAFE_NAME_RE.sub("_", track.track_name).strip() or track.file_id
 
+        blobs = await loop.run_in_executor(_POOL, _build_clips, pcm, sr, track.regions)
+        names = []
         for i, region in enumerate(track.regions, start=1):
-            start_ms = int(region.start * 1000)
-            end_ms = int(region.end * 1000)
-            clip = audio[start_ms:end_ms]
-
-            clip_buf = io.BytesIO()
-            clip.export(clip_buf, format="wav")
-            clip_bytes = clip_buf.getvalue()
-
             name = f"clip_{i:03d}_{region.start:.3f}s-{region.end:.3f}s.wav"
-            key = f"clips/{timestamp}_{safe_name}/{name}"
-            url = upload_to_r2(clip_bytes, key)
             logger.info("    Clip %d: %.3fs-%.3fs name=%s", i, region.start, region.end, name)
+            names.append(name)
+        tar_bytes = await loop.run_in_executor(_POOL, _tar_clips, names, blobs, timestamp)
+        key = f"clips/{timestamp}_{safe_name}.tar"
+        tracks_out.append((safe_name, key, tar_bytes, list(zip(names, track.regions))))
+
+    # Phase 2 (I/O): one concurrent upload per track instead of per clip,
+    # amortizing the per-request S3 latency across all of its clips.
+    urls = await asyncio.gather(
+        *[upload_to_r2(tar, key, content_type="application/x-tar") for _, key, tar, _ in tracks_out]
+    )
 
-            data_items.append({"content": name, "type": "TITLE"})
-            data_items.append({"content": f"https://{url}", "type": "AUDIO"})
+    data_items = []
+    for (safe_name, _, _, members), url in zip(tracks_out, urls):
+        data_items.append({"content": f"{safe_name}.tar", "type": "TITLE"})
+        data_items.append({"content": f"https://{url}", "type": "AUDIO"})
+        for name, region in members:
             data_items.append({
-                "content": f"start timestamp {region.start:.3f} / end timestamp {region.end:.3f}",
+                "content": f"{name}: start timestamp {region.start:.3f} / end timestamp {region.end:.3f}",
                 "type": "TEXT",
             })
-            # data_items.append({"content": f"Download URL {url}", "type": "TEXT"})
 
     logger.info("clip-multi done: %d data items generated", len(data_items))
     return [{"info": {"data": data_items}}]